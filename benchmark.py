@@ -0,0 +1,309 @@
+import argparse
+import json
+import math
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from collections import deque
+
+from search_engines import alpha_beta as ab
+from search_engines import astar, bfs
+from search_engines.stats import SearchStats, collapsed_stacks
+
+SEED = 1234
+WARMUP = 2
+REPEATS = 10
+THRESHOLD = 0.10
+
+MAZE_SIZES = [10, 20, 30]
+# find_path's squared-distance heuristic makes the work per maze heavy-tailed,
+# so each A* run solves a batch of mazes rather than a single one.
+MAZES_PER_SIZE = 5
+# Tic-tac-toe is fixed at 3x3, so the board sweep is over how many cells are
+# still empty after a seeded random opening. X opens, as in the game loop, so
+# only even counts leave O to move, the side minimax and find_best_move play.
+EMPTY_CELLS = [8, 6, 4]
+GRID_SIZES = [10, 20, 30]
+MCTS_ITERATIONS = [50, 100, 200]
+
+
+class Case:
+    """One benchmark point: an engine entry point at one sweep setting.
+
+    setup() builds fresh, seeded inputs outside the timed region and
+    run(args, stats=None) is the call being measured. check(stats), if given,
+    looks at the instrumented run and returns warnings about results that
+    should not be read as a scaling series.
+    """
+
+    def __init__(self, name, params, setup, run, check=None):
+        self.name = name
+        self.params = params
+        self.setup = setup
+        self.run = run
+        self.check = check
+
+    @property
+    def key(self):
+        return self.name + "[" + ",".join(f"{k}={v}" for k, v in sorted(self.params.items())) + "]"
+
+
+def is_reachable(maze, start, goal):
+    seen = {start}
+    queue = deque([start])
+    while queue:
+        x, y = queue.popleft()
+        if (x, y) == goal:
+            return True
+        for dx, dy in [(0, -1), (0, 1), (-1, 0), (1, 0)]:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < len(maze) and 0 <= ny < len(maze[0]) and maze[nx][ny] == 0 and (nx, ny) not in seen:
+                seen.add((nx, ny))
+                queue.append((nx, ny))
+    return False
+
+
+# The A* and BFS sweeps pin their endpoints to opposite corners so the work
+# grows with the size instead of depending on where the random start, goal or
+# food happened to land.
+
+def astar_cases(sizes):
+    def make(size):
+        def setup():
+            random.seed(SEED + size)
+            start, goal = (0, 0), (size - 1, size - 1)
+            mazes = []
+            while len(mazes) < MAZES_PER_SIZE:
+                maze, _, _ = astar.generate_random_maze(size)
+                if maze[start[0]][start[1]] == 0 and is_reachable(maze, start, goal):
+                    mazes.append((maze, start, goal))
+            return mazes
+
+        def run(mazes, stats=None):
+            for maze, start, goal in mazes:
+                astar.find_path(maze, start, goal, stats=stats)
+
+        return Case("astar.find_path", {"maze_size": size}, setup, run)
+
+    return [make(size) for size in sizes]
+
+
+def alpha_beta_cases(empty_counts):
+    def make(empty):
+        def setup():
+            rng = random.Random(SEED + empty)
+            while True:
+                board = [[None, None, None], [None, None, None], [None, None, None]]
+                cells = ab.get_empty_cells(board)
+                rng.shuffle(cells)
+                for turn, (i, j) in enumerate(cells[:9 - empty]):
+                    board[i][j] = "X" if turn % 2 == 0 else "O"
+                if not ab.is_winner(board, "X") and not ab.is_winner(board, "O"):
+                    return board
+
+        def run_minimax(board, stats=None):
+            ab.minimax(board, 0, True, -math.inf, math.inf, stats)
+
+        params = {"empty_cells": empty}
+        return [
+            Case("alpha_beta.minimax", params, setup, run_minimax),
+            Case("alpha_beta.find_best_move", params, setup, ab.find_best_move),
+        ]
+
+    return [case for empty in empty_counts for case in make(empty)]
+
+
+def bfs_cases(sizes):
+    def make(size):
+        def setup():
+            random.seed(SEED + size)
+            game = bfs.SnakeGame()
+            game.width = game.height = size
+            game.snake = deque([(0, 0)])
+            game.food = (size - 1, size - 1)
+            return game
+
+        def run(game, stats=None):
+            game.bfs(stats)
+
+        return Case("bfs.SnakeGame.bfs", {"grid_size": size}, setup, run)
+
+    return [make(size) for size in sizes]
+
+
+def mcts_cases(iteration_counts):
+    # Only this engine needs numpy, so it is not imported for other runs.
+    from search_engines import monte_carlo as mc
+
+    def make(iterations):
+        def setup():
+            # Seeding here rather than in run() keeps the rollouts identical
+            # across repeats without putting the seeding inside the timing.
+            random.seed(SEED + iterations)
+            return mc.Node(mc.ConnectFourState())
+
+        def run(root, stats=None):
+            mc.monte_carlo_tree_search(root, iterations, stats)
+
+        def check(stats):
+            # Every iteration should end in one rollout; fewer means the tree
+            # stopped growing and the sweep no longer scales with iterations.
+            if stats.rollouts < iterations:
+                return [f"only {stats.rollouts} of {iterations} iterations ran a rollout"]
+            return []
+
+        return Case("mcts.monte_carlo_tree_search", {"iterations": iterations}, setup, run, check)
+
+    return [make(iterations) for iterations in iteration_counts]
+
+
+ENGINES = {
+    "astar": lambda: astar_cases(MAZE_SIZES),
+    "alpha_beta": lambda: alpha_beta_cases(EMPTY_CELLS),
+    "bfs": lambda: bfs_cases(GRID_SIZES),
+    "mcts": lambda: mcts_cases(MCTS_ITERATIONS),
+}
+
+
+def percentile(sorted_values, pct):
+    # Nearest-rank percentile, so p99 of a small sample is its maximum rather
+    # than an interpolated value that was never observed.
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def measure(case, warmup, repeats):
+    for _ in range(warmup):
+        case.run(case.setup())
+
+    samples = []
+    for _ in range(repeats):
+        args = case.setup()
+        start = time.perf_counter_ns()
+        case.run(args)
+        samples.append(time.perf_counter_ns() - start)
+    samples.sort()
+
+    # tracemalloc slows every allocation down, so peak memory gets its own
+    # untimed run.
+    args = case.setup()
+    tracemalloc.start()
+    try:
+        case.run(args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # So does the instrumented run that supplies the node counts, keeping the
+    # timed runs on the stats=None path.
+    stats = SearchStats(case.key)
+    case.run(case.setup(), stats)
+
+    nodes = stats.nodes_expanded
+    p50 = percentile(samples, 50)
+    return {
+        "name": case.name,
+        "params": case.params,
+        "repeats": repeats,
+        "nodes": nodes,
+        # Uninstrumented throughput; stats.nodes_per_sec below is measured on
+        # the instrumented run and is expected to be lower.
+        "nodes_per_sec_p50": nodes / (p50 / 1e9) if p50 else None,
+        "p50_ns": p50,
+        "p99_ns": percentile(samples, 99),
+        "min_ns": samples[0],
+        "mean_ns": sum(samples) // len(samples),
+        "peak_bytes": peak,
+        "stats": stats.to_dict(),
+        "warnings": case.check(stats) if case.check is not None else [],
+    }
+
+
+def run_benchmarks(engines, warmup=WARMUP, repeats=REPEATS):
+    results = {}
+    for engine in engines:
+        for case in ENGINES[engine]():
+            results[case.key] = measure(case, warmup, repeats)
+    return {
+        "meta": {
+            "seed": SEED,
+            "warmup": warmup,
+            "repeats": repeats,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+        },
+        "results": results,
+    }
+
+
+def compare(report, baseline, threshold=THRESHOLD):
+    # p50 is the gate: p99 over a handful of repeats is too noisy to fail on.
+    comparison = {"threshold": threshold, "regressions": [], "improvements": [], "missing": []}
+    for key, old in baseline["results"].items():
+        new = report["results"].get(key)
+        if new is None:
+            comparison["missing"].append(key)
+            continue
+        ratio = new["p50_ns"] / old["p50_ns"] if old["p50_ns"] else 1.0
+        entry = {"case": key, "baseline_p50_ns": old["p50_ns"], "p50_ns": new["p50_ns"], "ratio": round(ratio, 4)}
+        if ratio > 1 + threshold:
+            comparison["regressions"].append(entry)
+        elif ratio < 1 - threshold:
+            comparison["improvements"].append(entry)
+    return comparison
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless benchmark for the search engines.")
+    parser.add_argument("--engine", action="append", choices=sorted(ENGINES), help="engine to run (repeatable, default: all)")
+    parser.add_argument("--warmup", type=int, default=WARMUP)
+    parser.add_argument("--repeats", type=int, default=REPEATS)
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    parser.add_argument("--baseline", help="compare against a previously saved report")
+    parser.add_argument("--save-baseline", help="also save this run as the baseline at this path")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="allowed p50 slowdown before failing (default: 0.10)")
+    parser.add_argument("--collapsed", help="write per-phase timings as collapsed stacks for flamegraph/speedscope")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args.engine or sorted(ENGINES), args.warmup, args.repeats)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            report["comparison"] = compare(report, json.load(f), args.threshold)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    for key, result in report["results"].items():
+        for warning in result["warnings"]:
+            print(f"Warning: {key}: {warning}", file=sys.stderr)
+
+    if args.collapsed:
+        with open(args.collapsed, "w") as f:
+            for key, result in report["results"].items():
+                stats = result["stats"]
+                lines = collapsed_stacks(key, stats["phase_ns"], stats["elapsed_ns"])
+                if lines:
+                    f.write(lines + "\n")
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump({"meta": report["meta"], "results": report["results"]}, f, indent=2)
+            f.write("\n")
+
+    if report.get("comparison", {}).get("regressions"):
+        for entry in report["comparison"]["regressions"]:
+            print(f"Regression: {entry['case']} is {entry['ratio']:.2f}x baseline p50", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
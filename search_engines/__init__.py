@@ -0,0 +1,12 @@
+"""Search engines behind the demo scripts.
+
+    astar        find_path on grid mazes
+    alpha_beta   minimax / find_best_move for tic-tac-toe
+    bfs          SnakeGame.bfs food planner
+    monte_carlo  monte_carlo_tree_search for Connect Four (needs numpy)
+    stats        SearchStats instrumentation
+
+Importing the package or any engine module loads only the search code;
+matplotlib, pygame and tkinter are imported when a plot, game window or
+GUI entry point is actually used.
+"""
@@ -0,0 +1,238 @@
+import math
+import random
+import numpy as np
+
+class ConnectFourState:
+    def __init__(self):
+        self.board = np.zeros((6, 7), dtype=int)
+        self.current_player = 1  # Player 1: 1, Player 2: -1
+        self._is_terminal = False
+        self.reward = 0
+        
+    def is_terminal(self):
+        return self._is_terminal
+
+    def get_legal_actions(self):
+        if self.is_draw():
+            return []
+        return [col for col in range(7) if self.board[0][col] == 0]
+
+    def is_draw(self):
+        return all(self.board[0][col] != 0 for col in range(7))
+
+
+    def perform_action(self, action):
+        new_state = ConnectFourState()
+        new_state.board = np.copy(self.board)
+        for row in range(5, -1, -1):
+            if new_state.board[row][action] == 0:
+                new_state.board[row][action] = self.current_player
+                break
+        new_state.current_player = -self.current_player
+        new_state.check_winner()
+        return new_state
+
+    def check_winner(self):
+        # Check for a win horizontally, vertically, or diagonally
+        for row in range(6):
+            for col in range(4):
+                if all(self.board[row][col + i] == self.current_player for i in range(4)):
+                    self._is_terminal = True
+                    self.set_reward()
+                    return
+
+        for col in range(7):
+            for row in range(3):
+                if all(self.board[row + i][col] == self.current_player for i in range(4)):
+                    self._is_terminal = True
+                    self.set_reward()
+                    return
+
+        for row in range(3):
+            for col in range(4):
+                if all(self.board[row + i][col + i] == self.current_player for i in range(4)):
+                    self._is_terminal = True
+                    self.set_reward()
+                    return
+
+                if all(self.board[row + i][col + 3 - i] == self.current_player for i in range(4)):
+                    self._is_terminal = True
+                    self.set_reward()
+                    return
+
+        # Check for a draw
+        if all(self.board[0][col] != 0 for col in range(7)):
+            self._is_terminal = True
+            self.set_reward()
+
+    def set_reward(self):
+        if self._is_terminal:
+            if self.reward == 0:
+                self.reward = 0.5  # Draw
+            else:
+                self.reward = 1.0 if self.reward == self.current_player else -1.0
+
+    def get_reward(self):
+        return self.reward
+
+    def __str__(self):
+        return "\n".join([" ".join(["X" if cell == 1 else "O" if cell == -1 else "_" for cell in row]) for row in self.board])
+
+class Node:
+    def __init__(self, state, parent=None, action=None):
+        self.state = state
+        self.parent = parent
+        self.action = action
+        self.children = []
+        self.visits = 0
+        self.value = 0
+
+def uct(node):
+    if node.visits == 0:
+        return float('inf')
+    return (node.value / node.visits) + 1.41 * math.sqrt(math.log(node.parent.visits) / node.visits)
+
+def select(node):
+    # Descend only through fully expanded nodes, so every node gets each of
+    # its moves tried before the search goes deeper.
+    while node.children and len(node.children) == len(node.state.get_legal_actions()):
+        current_threats = get_threats(node.state)
+        
+        offense_weight = 1.0 if current_threats[node.state.current_player] else 0.5
+        defense_weight = 1.0 if current_threats[-node.state.current_player] else 0.5
+
+        if current_threats[-node.state.current_player]:
+            defense_weight = 2.0  
+
+        def score(child):
+            exploration = math.sqrt(math.log(node.visits) / child.visits)
+            offense_uct = child.value / child.visits + exploration
+            defense_uct = -child.value / child.visits + exploration
+            return offense_weight * offense_uct + defense_weight * defense_uct
+
+        node = max(node.children, key=score)
+
+    return node
+
+
+def get_threats(state):
+    threats = {1: False, -1: False} 
+
+    for row in range(6):
+        for col in range(4):
+            if all(state.board[row][col + i] == state.current_player for i in range(4)):
+                threats[state.current_player] = True
+
+            if all(state.board[row][col + i] == -state.current_player for i in range(4)):
+                threats[-state.current_player] = True
+
+    return threats
+
+def expand(node):
+    tried = {child.action for child in node.children}
+    action = random.choice([action for action in node.state.get_legal_actions() if action not in tried])
+    new_state = node.state.perform_action(action)
+    child_node = Node(new_state, parent=node, action=action)
+    node.children.append(child_node)
+    return child_node
+
+def simulate(node):
+    # Roll out on a local copy; the node has to keep its own state or the
+    # next select() sees a finished game and the search stops growing.
+    state = node.state
+    while not state.is_terminal():
+        action = random.choice(state.get_legal_actions())
+        state = state.perform_action(action)
+    return state.get_reward()
+
+def backpropagate(node, reward):
+    while node is not None:
+        node.visits += 1
+        node.value += reward
+        node = node.parent
+
+def monte_carlo_tree_search(root, iterations, stats=None):
+    if stats is not None:
+        lap = stats.start()
+
+    try:
+        for _ in range(iterations):
+            selected_node = select(root)
+            if stats is not None:
+                lap = stats.lap("select", lap)
+
+            # A finished game has nothing to expand; its rollout is just its
+            # own reward, which still gets backed up the tree.
+            if selected_node.state.is_terminal():
+                expanded_node = selected_node
+            else:
+                expanded_node = expand(selected_node)
+                if stats is not None:
+                    stats.nodes_expanded += 1
+                    stats.nodes_generated += 1
+                    stats.max_depth = max(stats.max_depth, node_depth(expanded_node))
+            if stats is not None:
+                lap = stats.lap("expand", lap)
+
+            reward = simulate(expanded_node)
+            if stats is not None:
+                lap = stats.lap("simulate", lap)
+                stats.rollouts += 1
+
+            backpropagate(expanded_node, reward)
+            if stats is not None:
+                lap = stats.lap("backpropagate", lap)
+
+        return max(root.children, key=lambda x: x.visits).state
+    finally:
+        if stats is not None:
+            stats.finish()
+
+def node_depth(node):
+    depth = 0
+    while node.parent is not None:
+        node = node.parent
+        depth += 1
+    return depth
+
+def play_connect_four():
+    initial_state = ConnectFourState()
+    root_node = Node(initial_state)
+
+    while not root_node.state.is_terminal():
+        print("Current state:")
+        print(root_node.state)
+
+        if root_node.state.current_player == 1:
+            player_move = int(input("Enter your move (column): "))
+            action = player_move
+        else:
+            print("Computer's turn:")
+            result_state = monte_carlo_tree_search(root_node, iterations=1000)
+            action = np.where(result_state.board[0] == 0)[0][0]
+
+        root_node = Node(root_node.state.perform_action(action))
+
+    print("Game over!")
+    print("Result:")
+    print(root_node.state)
+
+def main(argv=None):
+    # Only the CLI needs argparse.
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Play Connect Four against Monte Carlo tree search.")
+    parser.add_argument("--text", action="store_true", help="play in the terminal instead of the Tk window")
+    args = parser.parse_args(argv)
+
+    if args.text:
+        play_connect_four()
+        return
+
+    # Imported here so the search code above loads without tkinter.
+    from .monte_carlo_gui import ConnectFourGUI
+
+    ConnectFourGUI()
+
+if __name__ == "__main__":
+    main()
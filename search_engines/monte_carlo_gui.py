@@ -0,0 +1,60 @@
+import numpy as np
+import tkinter as tk
+from tkinter import messagebox
+
+from .monte_carlo import ConnectFourState, Node, monte_carlo_tree_search
+
+class ConnectFourGUI:
+    def __init__(self):
+        self.root = tk.Tk()
+        self.root.title("Connect Four")
+        self.buttons = []
+        self.create_board()
+        self.play_connect_four()
+
+    def create_board(self):
+        for i in range(6):
+            row_buttons = []
+            for j in range(7):
+                button = tk.Button(self.root, text=" ", width=4, height=2, command=lambda row=i, col=j: self.make_move(row, col))
+                button.grid(row=i, column=j)
+                row_buttons.append(button)
+            self.buttons.append(row_buttons)
+
+    def update_board(self, state):
+        for i in range(6):
+            for j in range(7):
+                if state.board[i][j] == 1:
+                    self.buttons[i][j].config(text="X", state=tk.DISABLED)
+                elif state.board[i][j] == -1:
+                    self.buttons[i][j].config(text="O", state=tk.DISABLED)
+
+    def make_move(self, row, col):
+        if not self.root_node.state.is_terminal() and self.root_node.state.current_player == 1:
+            self.root_node = Node(self.root_node.state.perform_action(col))
+            self.update_board(self.root_node.state)
+            self.computer_move()
+
+    def computer_move(self):
+        if not self.root_node.state.is_terminal() and self.root_node.state.current_player == -1:
+            result_state = monte_carlo_tree_search(self.root_node, iterations=1000)
+            action = np.where(result_state.board[0] == 0)[0][0]
+            self.root_node = Node(self.root_node.state.perform_action(action))
+            self.update_board(self.root_node.state)
+
+            if self.root_node.state.is_terminal():
+                self.show_result()
+
+    def show_result(self):
+        result = self.root_node.state.get_reward()
+        if result == 0:
+            messagebox.showinfo("Game Over", "Computer wins!")
+        elif result == 1:
+            messagebox.showinfo("Game Over", "You win!")
+        else:
+            messagebox.showinfo("Game Over", "You Win!")
+
+    def play_connect_four(self):
+        initial_state = ConnectFourState()
+        self.root_node = Node(initial_state)
+        self.root.mainloop()
@@ -0,0 +1,83 @@
+import time
+
+
+def collapsed_stacks(root, phase_ns, elapsed_ns):
+    # Collapsed-stack lines ("frame;frame value"), the format py-spy's raw
+    # output and flamegraph.pl/speedscope read, so engine phases can be viewed
+    # next to, or merged into, a sampling profile. Time outside any phase is
+    # charged to the root frame.
+    lines = [f"{root};{phase} {ns}" for phase, ns in phase_ns.items()]
+    other = elapsed_ns - sum(phase_ns.values())
+    if other > 0:
+        lines.append(f"{root} {other}")
+    return "\n".join(lines)
+
+
+class SearchStats:
+    """Counters and phase timings filled in by a search.
+
+    Every engine takes an optional ``stats=`` argument and only touches it
+    behind an ``if stats is not None`` check, so searches run without one do
+    no extra work. Engines call finish() from a finally block, so a search
+    that raises still closes its start(). Pass a callback to be handed the
+    stats when the outermost search call returns.
+    """
+
+    def __init__(self, engine="search", callback=None):
+        self.engine = engine
+        self.callback = callback
+        self.nodes_expanded = 0
+        self.nodes_generated = 0
+        self.cutoffs = 0
+        self.tt_hits = 0  # transposition / closed-set / visited-set hits
+        self.peak_open = 0
+        self.rollouts = 0
+        self.max_depth = 0
+        self.elapsed_ns = 0
+        self.phase_ns = {}
+        self._running = 0
+        self._started_at = 0
+
+    def start(self):
+        # Searches nest (find_best_move -> minimax), so only the outermost
+        # start/finish pair is timed and reported.
+        if self._running == 0:
+            self._started_at = time.perf_counter_ns()
+        self._running += 1
+        return time.perf_counter_ns()
+
+    def lap(self, phase, since):
+        now = time.perf_counter_ns()
+        self.phase_ns[phase] = self.phase_ns.get(phase, 0) + now - since
+        return now
+
+    def finish(self):
+        self._running -= 1
+        if self._running == 0:
+            self.elapsed_ns += time.perf_counter_ns() - self._started_at
+            if self.callback is not None:
+                self.callback(self)
+        return self
+
+    def to_dict(self):
+        seconds = self.elapsed_ns / 1e9
+        return {
+            "engine": self.engine,
+            "nodes_expanded": self.nodes_expanded,
+            "nodes_generated": self.nodes_generated,
+            "cutoffs": self.cutoffs,
+            "tt_hits": self.tt_hits,
+            "peak_open": self.peak_open,
+            "rollouts": self.rollouts,
+            "max_depth": self.max_depth,
+            "elapsed_ns": self.elapsed_ns,
+            "nodes_per_sec": self.nodes_expanded / seconds if seconds else None,
+            "rollouts_per_sec": self.rollouts / seconds if seconds else None,
+            "phase_ns": dict(self.phase_ns),
+        }
+
+    def to_collapsed(self, prefix=None):
+        return collapsed_stacks(prefix or self.engine, self.phase_ns, self.elapsed_ns)
+
+    def __repr__(self):
+        return f"SearchStats({self.to_dict()!r})"
@@ -0,0 +1,37 @@
+from benchmark import compare, percentile
+
+
+def report(**p50s):
+    return {"results": {key: {"p50_ns": value} for key, value in p50s.items()}}
+
+
+def test_percentile_is_nearest_rank():
+    values = list(range(1, 11))
+    assert percentile(values, 50) == 5
+    assert percentile(values, 99) == 10
+    assert percentile(values, 0) == 1
+    assert percentile([7], 99) == 7
+
+
+def test_compare_flags_regressions_and_improvements():
+    baseline = report(slow=100, fast=100, same=100)
+    current = report(slow=120, fast=50, same=105)
+
+    comparison = compare(current, baseline, threshold=0.10)
+
+    assert [entry["case"] for entry in comparison["regressions"]] == ["slow"]
+    assert comparison["regressions"][0]["ratio"] == 1.2
+    assert [entry["case"] for entry in comparison["improvements"]] == ["fast"]
+    assert comparison["missing"] == []
+
+
+def test_compare_reports_missing_cases():
+    comparison = compare(report(kept=100), report(kept=100, dropped=100))
+
+    assert comparison["missing"] == ["dropped"]
+    assert comparison["regressions"] == []
+
+
+def test_compare_ignores_zero_baseline():
+    comparison = compare(report(case=50), report(case=0))
+    assert comparison["regressions"] == comparison["improvements"] == []
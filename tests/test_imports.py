@@ -0,0 +1,30 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def imported_after(code):
+    script = code + "\nimport sys\nprint(sorted(m for m in ('argparse', 'matplotlib', 'pygame', 'tkinter') if m in sys.modules))"
+    return subprocess.run([sys.executable, "-c", script], cwd=ROOT, capture_output=True, text=True, check=True).stdout.strip()
+
+
+def test_engines_import_without_ui_or_cli_libraries():
+    code = "import search_engines.astar, search_engines.alpha_beta, search_engines.bfs, search_engines.monte_carlo"
+    assert imported_after(code) == "[]"
+
+
+def test_monte_carlo_shim_exposes_gui_lazily():
+    assert imported_after("import Monte_Carlo") == "[]"
+    assert imported_after("from Monte_Carlo import ConnectFourGUI") == "['tkinter']"
+
+
+def test_cli_help_exits_before_running():
+    for module in ("astar", "alpha_beta", "bfs", "monte_carlo"):
+        result = subprocess.run(
+            [sys.executable, "-m", f"search_engines.{module}", "--help"],
+            cwd=ROOT, capture_output=True, text=True, timeout=30,
+        )
+        assert result.returncode == 0
+        assert result.stdout.startswith("usage:")
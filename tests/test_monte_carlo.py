@@ -0,0 +1,18 @@
+import random
+
+from search_engines.monte_carlo import ConnectFourState, Node, monte_carlo_tree_search
+from search_engines.stats import SearchStats
+
+
+def test_rollouts_leave_expanded_nodes_unfinished():
+    random.seed(0)
+    root = Node(ConnectFourState())
+    stats = SearchStats()
+
+    monte_carlo_tree_search(root, 20, stats)
+
+    assert stats.rollouts > 1
+    assert root.children
+    for child in root.children:
+        assert not child.state.is_terminal()
+        assert child.state.board.sum() == 1
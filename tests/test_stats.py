@@ -0,0 +1,132 @@
+import math
+import random
+
+import pytest
+
+from search_engines import alpha_beta, astar
+from search_engines.bfs import SnakeGame
+from search_engines.monte_carlo import ConnectFourState, Node, monte_carlo_tree_search
+from search_engines.stats import SearchStats, collapsed_stacks
+
+
+def empty_board():
+    return [[None, None, None], [None, None, None], [None, None, None]]
+
+
+def test_nested_start_finish_reports_once():
+    calls = []
+    stats = SearchStats(callback=calls.append)
+
+    stats.start()
+    stats.start()
+    stats.finish()
+    assert calls == []
+    stats.finish()
+
+    assert calls == [stats]
+    assert stats.elapsed_ns > 0
+
+
+def test_lap_accumulates_per_phase():
+    stats = SearchStats()
+    lap = stats.start()
+    lap = stats.lap("select", lap)
+    stats.lap("select", lap)
+    stats.finish()
+
+    assert list(stats.phase_ns) == ["select"]
+    assert stats.phase_ns["select"] <= stats.elapsed_ns
+
+
+def test_search_that_raises_still_finishes():
+    calls = []
+    stats = SearchStats(callback=calls.append)
+
+    with pytest.raises(TypeError):
+        astar.find_path(None, (0, 0), (1, 1), stats=stats)
+    assert calls == [stats]
+
+    astar.find_path([[0, 0], [0, 0]], (0, 0), (1, 1), stats=stats)
+    assert len(calls) == 2
+
+
+def test_minimax_reports_and_fires_callback():
+    calls = []
+    stats = SearchStats(callback=calls.append)
+
+    alpha_beta.minimax(empty_board(), 0, True, -math.inf, math.inf, stats)
+
+    assert calls == [stats]
+    assert stats.elapsed_ns > 0
+    assert stats.nodes_expanded == stats.nodes_generated + 1
+    assert stats.cutoffs > 0
+
+
+def test_find_best_move_reports_depth_like_minimax():
+    via_minimax = SearchStats()
+    alpha_beta.minimax(empty_board(), 0, True, -math.inf, math.inf, via_minimax)
+    via_best_move = SearchStats()
+    alpha_beta.find_best_move(empty_board(), via_best_move)
+
+    assert via_best_move.max_depth == via_minimax.max_depth == 9
+    assert via_best_move.nodes_expanded == via_best_move.nodes_generated + 1
+
+
+@pytest.mark.parametrize("board", [
+    [["X", "O", "X"], ["X", "O", "O"], ["O", "X", None]],
+    [["X", "O", "X"], ["X", "O", None], ["O", "X", None]],
+])
+def test_find_best_move_counts_match_minimax(board):
+    # find_best_move searches each root move with a full window, so the two
+    # only walk the same tree when there is nothing left to prune.
+    def counts(stats):
+        return stats.nodes_expanded, stats.nodes_generated, stats.max_depth
+
+    via_minimax = SearchStats()
+    alpha_beta.minimax([row[:] for row in board], 0, True, -math.inf, math.inf, via_minimax)
+    via_best_move = SearchStats()
+    alpha_beta.find_best_move([row[:] for row in board], via_best_move)
+
+    assert counts(via_best_move) == counts(via_minimax)
+
+
+def test_mcts_reports_rollouts_depth_and_phases():
+    random.seed(0)
+    stats = SearchStats("mcts")
+
+    monte_carlo_tree_search(Node(ConnectFourState()), 30, stats)
+
+    assert stats.rollouts > 0
+    assert stats.max_depth >= 1
+    assert set(stats.phase_ns) == {"select", "expand", "simulate", "backpropagate"}
+    assert sum(stats.phase_ns.values()) <= stats.elapsed_ns
+
+
+def test_stats_do_not_change_results():
+    maze = [[0, 0, 0], [1, 1, 0], [0, 0, 0]]
+    plain = astar.find_path(maze, (0, 0), (2, 0))
+    stats = SearchStats()
+    instrumented = astar.find_path(maze, (0, 0), (2, 0), stats=stats)
+    assert instrumented[0] == plain[0]
+    assert stats.nodes_expanded > 0 and stats.peak_open > 0
+
+    game = SnakeGame()
+    stats = SearchStats()
+    assert game.bfs(stats) == game.bfs()
+    assert stats.nodes_expanded > 0
+
+
+def test_collapsed_stacks_charges_remainder_to_root():
+    text = collapsed_stacks("astar", {"select": 30, "expand": 50}, 100)
+    assert text.splitlines() == ["astar;select 30", "astar;expand 50", "astar 20"]
+
+    assert collapsed_stacks("bfs", {}, 0) == ""
+    assert collapsed_stacks("mcts", {"simulate": 10}, 10) == "mcts;simulate 10"
+
+
+def test_to_collapsed_uses_engine_name():
+    stats = SearchStats("mcts")
+    stats.phase_ns = {"select": 5}
+    stats.elapsed_ns = 5
+    assert stats.to_collapsed() == "mcts;select 5"
+    assert stats.to_collapsed("case") == "case;select 5"